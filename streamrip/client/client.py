@@ -14,6 +14,9 @@ logger = logging.getLogger("streamrip")
 DEFAULT_USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:83.0) Gecko/20100101 Firefox/83.0"
 )
+# A client talks to the same few API and CDN hosts for the whole run, so keep
+# DNS results and idle connections around longer than aiohttp's defaults
+CONNECTOR_KWARGS = {"ttl_dns_cache": 300, "keepalive_timeout": 30}
 
 
 class Client(ABC):
@@ -54,5 +57,6 @@ class Client(ABC):
             headers = {}
         return aiohttp.ClientSession(
             headers={"User-Agent": DEFAULT_USER_AGENT},
+            connector=aiohttp.TCPConnector(**CONNECTOR_KWARGS),
             **headers,
         )
@@ -18,7 +18,7 @@ from ..exceptions import (
     MissingCredentialsError,
     NonStreamableError,
 )
-from .client import Client
+from .client import CONNECTOR_KWARGS, Client
 from .downloadable import BasicDownloadable, Downloadable
 
 logger = logging.getLogger("streamrip")
@@ -124,7 +124,9 @@ class QobuzSpoofer:
         return app_id, secrets_list
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(**CONNECTOR_KWARGS),
+        )
         return self
 
     async def __aexit__(self, *_):
@@ -31,11 +31,15 @@ class Album(Media):
         progress.add_title(self.meta.album)
 
     async def download(self):
-        async def _resolve_and_download(pending: Pending):
-            track = await pending.resolve()
-            if track is None:
-                return
-            await track.rip()
+        async def _resolve_and_download(pending: PendingTrack):
+            # A failed track should not cancel the rest of the album
+            try:
+                track = await pending.resolve()
+                if track is None:
+                    return
+                await track.rip()
+            except Exception as e:
+                logger.error(f"Error downloading track {pending.id}: {e}")
 
         await asyncio.gather(*[_resolve_and_download(p) for p in self.tracks])
 
@@ -1,6 +1,7 @@
 import asyncio
 import logging
 import re
+from collections import defaultdict
 from dataclasses import dataclass
 
 from ..client import Client
@@ -107,35 +108,23 @@ class Artist(Media):
         It determines that two albums are identical if they have the same title
         ignoring contents in brackets or parentheses.
         """
-        groups: dict[str, list[Album]] = {}
+        groups: defaultdict[str, list[Album]] = defaultdict(list)
         for a in albums:
             match = self._essence.match(a.meta.album)
             assert match is not None
-            title = match.group(1).strip().lower()
-            items = groups.get(title, [])
-            items.append(a)
-            groups[title] = items
-
-        ret: list[Album] = []
-        for group in groups.values():
-            best = None
-            max_bd, max_sr = 0, 0
-            # assume that highest bd is always with highest sr
-            for album in group:
-                bd = album.meta.info.bit_depth or 0
-                if bd > max_bd:
-                    max_bd = bd
-                    best = album
-
-                sr = album.meta.info.sampling_rate or 0
-                if sr > max_sr:
-                    max_sr = sr
-                    best = album
-
-            assert best is not None  # true because all g != []
-            ret.append(best)
-
-        return ret
+            groups[match.group(1).strip().lower()].append(a)
+
+        # highest bit depth wins, and sampling rate breaks ties
+        return [
+            max(
+                group,
+                key=lambda a: (
+                    a.meta.info.bit_depth or 0,
+                    a.meta.info.sampling_rate or 0,
+                ),
+            )
+            for group in groups.values()
+        ]
 
     _extra_re = re.compile(
         r"(?i)(anniversary|deluxe|live|collector|demo|expanded|remix)"
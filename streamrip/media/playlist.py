@@ -120,10 +120,14 @@ class Playlist(Media):
         track_resolve_chunk_size = 20
 
         async def _resolve_download(item: PendingPlaylistTrack):
-            track = await item.resolve()
-            if track is None:
-                return
-            await track.rip()
+            # A failed track should not cancel the rest of the playlist
+            try:
+                track = await item.resolve()
+                if track is None:
+                    return
+                await track.rip()
+            except Exception as e:
+                logger.error(f"Error downloading track {item.id}: {e}")
 
         batches = self.batch(
             [_resolve_download(track) for track in self.tracks],
@@ -174,11 +174,10 @@ class PendingSingle(Pending):
         config = self.config.session
         quality = getattr(config, self.client.source).quality
         assert isinstance(quality, int)
-        parent = config.downloads.folder
         if config.filepaths.add_singles_to_folder:
-            folder = os.path.join(parent, self._format_folder(album))
+            folder = self._format_folder(album)
         else:
-            folder = parent
+            folder = config.downloads.folder
 
         os.makedirs(folder, exist_ok=True)
 
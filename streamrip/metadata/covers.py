@@ -1,19 +1,20 @@
+from typing import ClassVar
+
 TIDAL_COVER_URL = "https://resources.tidal.com/images/{uuid}/{width}x{height}.jpg"
 
 
 class Covers:
     COVER_SIZES = ("thumbnail", "small", "large", "original")
+    # index of each size in `_covers`, which is ordered from largest to smallest
+    _SIZE_INDEX: ClassVar[dict[str, int]] = {
+        s: i for i, s in enumerate(reversed(COVER_SIZES))
+    }
     CoverEntry = tuple[str, str | None, str | None]
     _covers: list[CoverEntry]
 
     def __init__(self):
         # ordered from largest to smallest
-        self._covers = [
-            ("original", None, None),
-            ("large", None, None),
-            ("small", None, None),
-            ("thumbnail", None, None),
-        ]
+        self._covers = [(s, None, None) for s in reversed(self.COVER_SIZES)]
 
     def set_cover(self, size: str, url: str | None, path: str | None):
         i = self._indexof(size)
@@ -22,17 +23,12 @@ class Covers:
     def set_cover_url(self, size: str, url: str):
         self.set_cover(size, url, None)
 
-    @staticmethod
-    def _indexof(size: str) -> int:
-        if size == "original":
-            return 0
-        if size == "large":
-            return 1
-        if size == "small":
-            return 2
-        if size == "thumbnail":
-            return 3
-        raise Exception(f"Invalid {size = }")
+    @classmethod
+    def _indexof(cls, size: str) -> int:
+        i = cls._SIZE_INDEX.get(size)
+        if i is None:
+            raise Exception(f"Invalid {size = }")
+        return i
 
     def empty(self) -> bool:
         return all(url is None for _, url, _ in self._covers)
@@ -98,14 +94,10 @@ class Covers:
         return c
 
     def get_size(self, size: str) -> CoverEntry:
-        i = self._indexof(size)
-        size, url, path = self._covers[i]
-        if url is not None:
-            return (size, url, path)
-        if i + 1 < len(self._covers):
-            for s, u, p in self._covers[i + 1 :]:
-                if u is not None:
-                    return (s, u, p)
+        # fall back to the next smallest available size
+        for s, u, p in self._covers[self._indexof(size) :]:
+            if u is not None:
+                return (s, u, p)
         raise Exception(f"Cover not found for {size = }. Available: {self}")
 
     @staticmethod
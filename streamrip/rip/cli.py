@@ -411,20 +411,26 @@ async def id(ctx, source, media_type, id):
             await main.rip()
 
 
-async def latest_streamrip_version() -> tuple[str, str | None]:
-    async with aiohttp.ClientSession() as s:
-        async with s.get("https://pypi.org/pypi/streamrip/json") as resp:
-            data = await resp.json()
-        version = data["info"]["version"]
-
-        if version == __version__:
-            return version, None
-
-        async with s.get(
-            "https://api.github.com/repos/nathom/streamrip/releases/latest"
-        ) as resp:
-            json = await resp.json()
-        notes = json["body"]
+async def latest_streamrip_version(
+    session: aiohttp.ClientSession | None = None,
+) -> tuple[str, str | None]:
+    # Reuse the caller's session if there is one, to avoid a new connection pool
+    if session is None:
+        async with aiohttp.ClientSession() as s:
+            return await latest_streamrip_version(s)
+
+    async with session.get("https://pypi.org/pypi/streamrip/json") as resp:
+        data = await resp.json()
+    version = data["info"]["version"]
+
+    if version == __version__:
+        return version, None
+
+    async with session.get(
+        "https://api.github.com/repos/nathom/streamrip/releases/latest"
+    ) as resp:
+        json = await resp.json()
+    notes = json["body"]
     return version, notes
 
 
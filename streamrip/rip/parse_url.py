@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import logging
 import re
 from abc import ABC, abstractmethod
@@ -217,9 +218,32 @@ class SoundcloudURL(URL):
         return cls(soundcloud_url.group(0))
 
 
+# Every URL type below matches one of these hosts, so anything else can be
+# rejected without running a regex
+KNOWN_HOSTS = (
+    "qobuz.com",
+    "tidal.com",
+    "deezer.com",
+    "deezer.page.link",
+    "soundcloud.com",
+)
+
+# Tried in order by `parse_url`, stopping at the first match
+URL_TYPES: tuple[type[URL], ...] = (
+    GenericURL,
+    QobuzInterpreterURL,
+    SoundcloudURL,
+    DeezerDynamicURL,
+    # TODO: the rest of the url types
+)
+
+
+@functools.lru_cache(maxsize=1024)
 def parse_url(url: str) -> URL | None:
     """Return a URL type given a url string.
 
+    Results are cached, so the returned URL must not be modified.
+
     Args:
     ----
         url (str): Url to parse
@@ -227,11 +251,11 @@ def parse_url(url: str) -> URL | None:
     Returns: A URL type, or None if nothing matched.
     """
     url = url.strip()
-    parsed_urls: list[URL | None] = [
-        GenericURL.from_str(url),
-        QobuzInterpreterURL.from_str(url),
-        SoundcloudURL.from_str(url),
-        DeezerDynamicURL.from_str(url),
-        # TODO: the rest of the url types
-    ]
-    return next((u for u in parsed_urls if u is not None), None)
+    if not any(host in url for host in KNOWN_HOSTS):
+        return None
+
+    for url_type in URL_TYPES:
+        parsed = url_type.from_str(url)
+        if parsed is not None:
+            return parsed
+    return None
@@ -0,0 +1,63 @@
+import copy
+import hashlib
+import json
+import os
+
+import pytest
+import pytest_asyncio
+
+from streamrip.client.qobuz import QobuzClient
+from streamrip.config import Config
+
+
+def pytest_collection_modifyitems(config, items):
+    if "QOBUZ_EMAIL" in os.environ:
+        return
+
+    skip = pytest.mark.skip(reason="Qobuz credentials not found in env.")
+    for item in items:
+        if "qobuz_client" in getattr(item, "fixturenames", ()):
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def _default_config_template() -> Config:
+    return Config.defaults()
+
+
+@pytest.fixture()
+def default_config(_default_config_template) -> Config:
+    # Copy so that tests can modify it freely
+    return copy.deepcopy(_default_config_template)
+
+
+@pytest.fixture(scope="session")
+def qobuz_album_resp() -> dict:
+    with open("tests/qobuz_album_resp.json") as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="session")
+def qobuz_track_resp() -> dict:
+    with open("tests/qobuz_track_resp.json") as f:
+        return json.load(f)
+
+
+# The client's aiohttp session is bound to the loop it was created on, so tests
+# that use it must be marked `pytest.mark.asyncio(loop_scope="session")`
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def qobuz_client(_default_config_template):
+    config = copy.deepcopy(_default_config_template)
+    config.session.qobuz.email_or_userid = os.environ["QOBUZ_EMAIL"]
+    config.session.qobuz.password_or_token = hashlib.md5(
+        os.environ["QOBUZ_PASSWORD"].encode("utf-8"),
+    ).hexdigest()
+    if "QOBUZ_APP_ID" in os.environ and "QOBUZ_SECRETS" in os.environ:
+        config.session.qobuz.app_id = os.environ["QOBUZ_APP_ID"]
+        config.session.qobuz.secrets = os.environ["QOBUZ_SECRETS"].split(",")
+    client = QobuzClient(config)
+    await client.login()
+
+    yield client
+
+    await client.session.close()
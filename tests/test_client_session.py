@@ -0,0 +1,14 @@
+import aiohttp
+
+from streamrip.client.client import Client
+
+
+async def test_get_session_connector(mocker):
+    # Checked on the constructor call, since aiohttp keeps these settings private
+    connector = mocker.spy(aiohttp, "TCPConnector")
+    session = await Client.get_session()
+    try:
+        connector.assert_called_once_with(ttl_dns_cache=300, keepalive_timeout=30)
+        assert session.connector is connector.spy_return
+    finally:
+        await session.close()
@@ -1,28 +1,60 @@
-import shutil
+import copy
 
 import pytest
 
-from streamrip.config import *
+from streamrip.config import (
+    ArtworkConfig,
+    CliConfig,
+    Config,
+    ConfigData,
+    ConversionConfig,
+    DatabaseConfig,
+    DeezerConfig,
+    DownloadsConfig,
+    FilepathsConfig,
+    LastFmConfig,
+    MetadataConfig,
+    MiscConfig,
+    QobuzConfig,
+    QobuzDiscographyFilterConfig,
+    SoundcloudConfig,
+    TidalConfig,
+    YoutubeConfig,
+)
 
 SAMPLE_CONFIG = "tests/test_config.toml"
 
 
+@pytest.fixture(scope="session")
+def sample_config_text() -> str:
+    with open(SAMPLE_CONFIG) as f:
+        return f.read()
+
+
 # Define a fixture to create a sample ConfigData instance for testing
-@pytest.fixture()
-def sample_config_data() -> ConfigData:
+# The TOML file is only parsed once per session, so tests must not mutate it
+@pytest.fixture(scope="session")
+def sample_config_data(sample_config_text) -> ConfigData:
     # Create a sample ConfigData instance here
     # You can customize this to your specific needs for testing
-    with open(SAMPLE_CONFIG) as f:
-        config_data = ConfigData.from_toml(f.read())
+    config_data = ConfigData.from_toml(sample_config_text)
     return config_data
 
 
-# Define a fixture to create a sample Config instance for testing
+# Use this one instead of `sample_config_data` if the test modifies the data
 @pytest.fixture()
-def sample_config() -> Config:
+def fresh_config_data(sample_config_data) -> ConfigData:
+    return copy.deepcopy(sample_config_data)
+
+
+# Define a fixture to create a sample Config instance for testing
+@pytest.fixture(scope="session")
+def sample_config(sample_config_text, tmp_path_factory) -> Config:
     # Create a sample Config instance here
     # You can customize this to your specific needs for testing
-    config = Config(SAMPLE_CONFIG)
+    config_path = tmp_path_factory.mktemp("config") / "config.toml"
+    config_path.write_text(sample_config_text)
+    config = Config(str(config_path))
     return config
 
 
@@ -31,10 +63,10 @@ def test_sample_config_data_properties(sample_config_data):
     assert sample_config_data.modified is False  # Ensure initial state is not modified
 
 
-def test_sample_config_data_modification(sample_config_data):
+def test_sample_config_data_modification(fresh_config_data):
     # Test modifying ConfigData and checking modified property
-    sample_config_data.set_modified()
-    assert sample_config_data._modified is True
+    fresh_config_data.set_modified()
+    assert fresh_config_data._modified is True
 
 
 def test_sample_config_data_fields(sample_config_data):
@@ -154,15 +186,14 @@ def test_sample_config_data_fields(sample_config_data):
 #     mockf.assert_called_once()
 
 
-def test_config_update_on_save():
-    tmp_config_path = "tests/config2.toml"
-    shutil.copy(SAMPLE_CONFIG, tmp_config_path)
-    conf = Config(tmp_config_path)
+def test_config_update_on_save(sample_config_text, tmp_path):
+    tmp_config_path = tmp_path / "config2.toml"
+    tmp_config_path.write_text(sample_config_text)
+    conf = Config(str(tmp_config_path))
     conf.file.downloads.folder = "new_folder"
     conf.file.set_modified()
     conf.save_file()
-    conf2 = Config(tmp_config_path)
-    os.remove(tmp_config_path)
+    conf2 = Config(str(tmp_config_path))
 
     assert conf2.session.downloads.folder == "new_folder"
 
@@ -180,14 +211,13 @@ def test_config_update_on_save():
 #     assert conf2.session.downloads.folder == "new_folder"
 
 
-def test_config_dont_update_without_set_modified():
-    tmp_config_path = "tests/config2.toml"
-    shutil.copy(SAMPLE_CONFIG, tmp_config_path)
-    conf = Config(tmp_config_path)
+def test_config_dont_update_without_set_modified(sample_config_text, tmp_path):
+    tmp_config_path = tmp_path / "config2.toml"
+    tmp_config_path.write_text(sample_config_text)
+    conf = Config(str(tmp_config_path))
     conf.file.downloads.folder = "new_folder"
     del conf
-    conf2 = Config(tmp_config_path)
-    os.remove(tmp_config_path)
+    conf2 = Config(str(tmp_config_path))
 
     assert conf2.session.downloads.folder == "test_folder"
 
@@ -1,17 +1,22 @@
 import pytest
-import tomlkit
+
+try:
+    import tomllib
+except ImportError:  # python < 3.11
+    import tomlkit as tomllib
 
 from streamrip.config import *
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def toml():
     with open("streamrip/config.toml") as f:
-        t = tomlkit.parse(f.read())  # type: ignore
+        t = tomllib.loads(f.read())
     return t
 
 
-@pytest.fixture()
+# Only read by the tests below, so it's safe to share
+@pytest.fixture(scope="session")
 def config():
     return ConfigData.defaults()
 
@@ -20,7 +25,7 @@ def test_toml_subset_of_py(toml, config):
     """Test that all keys in the TOML file are in the config classes."""
     for k, v in toml.items():
         if k in config.__slots__:
-            if isinstance(v, TOMLDocument):
+            if isinstance(v, dict):
                 test_toml_subset_of_py(v, getattr(config, k))
         else:
             raise Exception(f"{k} not in {config.__slots__}")
@@ -2,70 +2,50 @@ import pytest
 
 from streamrip.metadata import Covers
 
-
-@pytest.fixture()
-def covers_all():
-    c = Covers()
-    c.set_cover("original", "ourl", None)
-    c.set_cover("large", "lurl", None)
-    c.set_cover("small", "surl", None)
-    c.set_cover("thumbnail", "turl", None)
-
-    return c
+# ordered from largest to smallest
+SIZES = ["original", "large", "small", "thumbnail"]
 
 
-@pytest.fixture()
-def covers_none():
-    return Covers()
+def entry(size: str):
+    return (size, f"{size[0]}url", None)
 
 
-@pytest.fixture()
-def covers_one():
+@pytest.fixture(
+    params=[SIZES, SIZES[1:3], ["small"], []],
+    ids=["all", "some", "one", "none"],
+)
+def covers(request):
     c = Covers()
-    c.set_cover("small", "surl", None)
-    return c
+    for size in request.param:
+        c.set_cover(*entry(size))
 
-
-@pytest.fixture()
-def covers_some():
-    c = Covers()
-    c.set_cover("large", "lurl", None)
-    c.set_cover("small", "surl", None)
-    return c
+    return c, request.param
 
 
-def test_covers_all(covers_all):
-    assert covers_all._covers == [
-        ("original", "ourl", None),
-        ("large", "lurl", None),
-        ("small", "surl", None),
-        ("thumbnail", "turl", None),
+def test_covers_contents(covers):
+    c, present = covers
+    assert c._covers == [
+        entry(size) if size in present else (size, None, None) for size in SIZES
     ]
-    assert covers_all.largest() == ("original", "ourl", None)
-    assert covers_all.get_size("original") == ("original", "ourl", None)
-    assert covers_all.get_size("thumbnail") == ("thumbnail", "turl", None)
-
-
-def test_covers_none(covers_none):
-    assert covers_none.empty()
-    with pytest.raises(Exception):
-        covers_none.largest()
-    with pytest.raises(Exception):
-        covers_none.get_size("original")
-
-
-def test_covers_one(covers_one):
-    assert not covers_one.empty()
-    assert covers_one.largest() == ("small", "surl", None)
-    assert covers_one.get_size("original") == ("small", "surl", None)
-    with pytest.raises(Exception):
-        covers_one.get_size("thumbnail")
-
-
-def test_covers_some(covers_some):
-    assert not covers_some.empty()
-    assert covers_some.largest() == ("large", "lurl", None)
-    assert covers_some.get_size("original") == ("large", "lurl", None)
-    assert covers_some.get_size("small") == ("small", "surl", None)
-    with pytest.raises(Exception):
-        covers_some.get_size("thumbnail")
+    assert c.empty() == (len(present) == 0)
+
+
+def test_covers_largest(covers):
+    c, present = covers
+    if len(present) == 0:
+        with pytest.raises(Exception):
+            c.largest()
+    else:
+        assert c.largest() == entry(present[0])
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_covers_get_size(covers, size):
+    c, present = covers
+    # falls back to the next smallest size that is available
+    available = [s for s in SIZES[SIZES.index(size) :] if s in present]
+    if len(available) == 0:
+        with pytest.raises(Exception):
+            c.get_size(size)
+    else:
+        assert c.get_size(size) == entry(available[0])
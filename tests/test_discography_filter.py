@@ -0,0 +1,58 @@
+import pytest
+
+from streamrip.media import Album, Artist
+from streamrip.metadata import AlbumInfo, AlbumMetadata, Covers
+
+
+def create_album(
+    id: str,
+    title: str,
+    bit_depth: int | None = None,
+    sampling_rate: int | float | None = None,
+) -> Album:
+    info = AlbumInfo(
+        id,
+        quality=0,
+        container="FLAC",
+        sampling_rate=sampling_rate,
+        bit_depth=bit_depth,
+    )
+    meta = AlbumMetadata(info, title, "artist", "2020", ["genre"], Covers(), 10)
+    return Album(meta, [], None, "folder", None)  # type: ignore
+
+
+# (album specs passed to `create_album`, ids of the albums that should be kept)
+CASES = {
+    "picks_highest_quality": (
+        [
+            ("a1", "Rumours", 16, 44.1),
+            ("a2", "Rumours (Deluxe)", 24, 96),
+            ("a3", "rumours (Remastered)", 24, 48),
+        ],
+        {"a2"},
+    ),
+    "keeps_distinct_titles": (
+        [
+            ("a1", "Rumours", 16, 44.1),
+            ("a2", "Tusk", 16, 44.1),
+            ("a3", "Tusk (Live)", 24, 96),
+        ],
+        {"a1", "a3"},
+    ),
+    "prefers_bit_depth_over_sampling_rate": (
+        [("a1", "Rumours", 24, 44.1), ("a2", "Rumours (Deluxe)", 16, 96)],
+        {"a1"},
+    ),
+    "missing_quality": (
+        [("a1", "Rumours"), ("a2", "Rumours (Deluxe)")],
+        {"a1"},
+    ),
+    "empty": ([], set()),
+}
+
+
+@pytest.mark.parametrize("specs,kept", CASES.values(), ids=CASES.keys())
+def test_filter_repeats(specs, kept):
+    artist = Artist("artist", [], None, None)  # type: ignore
+    albums = [create_album(*spec) for spec in specs]
+    assert {a.meta.info.id for a in artist._filter_repeats(albums)} == kept
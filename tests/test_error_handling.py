@@ -0,0 +1,40 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from streamrip.media import Album, Playlist
+
+# More than one playlist batch of tracks
+NUM_TRACKS = 25
+
+
+def make_tracks(failing_index: int) -> list[MagicMock]:
+    tracks = [
+        MagicMock(resolve=AsyncMock(return_value=MagicMock(rip=AsyncMock())))
+        for _ in range(NUM_TRACKS)
+    ]
+    tracks[failing_index].resolve.side_effect = Exception("resolve failed")
+    return tracks
+
+
+def assert_all_ripped(tracks: list[MagicMock], failing_index: int):
+    for i, t in enumerate(tracks):
+        t.resolve.assert_awaited_once()
+        if i != failing_index:
+            t.resolve.return_value.rip.assert_awaited_once()
+
+
+@pytest.mark.parametrize("failing_index", [0, NUM_TRACKS // 2, NUM_TRACKS - 1])
+async def test_album_handles_failed_track(failing_index):
+    tracks = make_tracks(failing_index)
+    album = Album(None, tracks, None, "folder", None)  # type: ignore
+    await album.download()
+    assert_all_ripped(tracks, failing_index)
+
+
+@pytest.mark.parametrize("failing_index", [0, NUM_TRACKS // 2, NUM_TRACKS - 1])
+async def test_playlist_handles_failed_track(failing_index):
+    tracks = make_tracks(failing_index)
+    playlist = Playlist("playlist", None, None, tracks)  # type: ignore
+    await playlist.download()
+    assert_all_ripped(tracks, failing_index)
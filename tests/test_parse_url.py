@@ -0,0 +1,66 @@
+import pytest
+
+from streamrip.rip.parse_url import (
+    DeezerDynamicURL,
+    GenericURL,
+    QobuzInterpreterURL,
+    SoundcloudURL,
+    parse_url,
+)
+
+
+@pytest.mark.parametrize(
+    "url,source,media_type,item_id",
+    [
+        (
+            "https://www.qobuz.com/us-en/album/rumours-fleetwood-mac/0603497941032",
+            "qobuz",
+            "album",
+            "0603497941032",
+        ),
+        ("https://open.qobuz.com/track/19512574", "qobuz", "track", "19512574"),
+        ("https://tidal.com/browse/album/83462017", "tidal", "album", "83462017"),
+        ("https://listen.tidal.com/artist/3501549", "tidal", "artist", "3501549"),
+        ("https://www.deezer.com/us/playlist/1234567", "deezer", "playlist", "1234567"),
+        ("  https://www.deezer.com/en/track/3135556\n", "deezer", "track", "3135556"),
+    ],
+)
+def test_parse_generic_url(url, source, media_type, item_id):
+    parsed = parse_url(url)
+    assert isinstance(parsed, GenericURL)
+    assert parsed.source == source
+    assert parsed.match.groups() == (source, media_type, item_id)
+
+
+def test_parse_qobuz_interpreter_url():
+    url = "https://www.qobuz.com/us-en/interpreter/fleetwood-mac/download-streaming-albums"
+    parsed = parse_url(url)
+    assert isinstance(parsed, QobuzInterpreterURL)
+    assert parsed.source == "qobuz"
+
+
+def test_parse_soundcloud_url():
+    url = "https://soundcloud.com/artist/some-track"
+    parsed = parse_url(url)
+    assert isinstance(parsed, SoundcloudURL)
+    assert parsed.url == url
+
+
+def test_parse_deezer_dynamic_url():
+    parsed = parse_url("https://deezer.page.link/abc123")
+    assert isinstance(parsed, DeezerDynamicURL)
+    assert parsed.source == "deezer"
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "",
+        "not a url",
+        "https://example.com/album/1234",
+        "https://open.spotify.com/album/4iV5W9uYEdYUVa79Axb7Rh",
+        "https://www.qobuz.com/us-en/shop",
+    ],
+)
+def test_parse_invalid_url(url):
+    assert parse_url(url) is None
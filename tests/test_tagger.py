@@ -1,3 +1,5 @@
+import shutil
+
 import pytest
 from mutagen.flac import FLAC
 from util import arun
@@ -8,14 +10,33 @@ test_flac = "tests/silence.flac"
 test_cover = "tests/1x1_pixel.jpg"
 
 
-def wipe_test_flac():
-    audio = FLAC(test_flac)
-    # Remove all tags
+@pytest.fixture(scope="session")
+def clean_flac_template(tmp_path_factory) -> str:
+    path = tmp_path_factory.mktemp("flac") / "template.flac"
+    shutil.copyfile(test_flac, path)
+    audio = FLAC(path)
+    # Remove all tags and embedded covers
     audio.delete()
+    audio.clear_pictures()
     audio.save()
+    return str(path)
 
 
 @pytest.fixture()
+def flac_copy(tmp_path, clean_flac_template) -> str:
+    path = tmp_path / "silence.flac"
+    shutil.copyfile(clean_flac_template, path)
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def cover_bytes() -> bytes:
+    with open(test_cover, "rb") as f:
+        return f.read()
+
+
+# tag_file only reads the metadata, so it can be shared
+@pytest.fixture(scope="session")
 def sample_metadata() -> TrackMetadata:
     return TrackMetadata(
         TrackInfo(
@@ -54,30 +75,10 @@ def sample_metadata() -> TrackMetadata:
     )
 
 
-def test_tag_flac_no_cover(sample_metadata):
-    wipe_test_flac()
-    arun(tag_file(test_flac, sample_metadata, None))
-    file = FLAC(test_flac)
-    assert file["title"][0] == "testtitle"
-    assert file["album"][0] == "testalbum"
-    assert file["composer"][0] == "testcomposer"
-    assert file["comment"][0] == "testcomment"
-    assert file["artist"][0] == "testartist"
-    assert file["albumartist"][0] == "testalbumartist"
-    assert file["year"][0] == "1999"
-    assert file["genre"][0] == "rock, pop"
-    assert file["tracknumber"][0] == "03"
-    assert file["discnumber"][0] == "01"
-    assert file["copyright"][0] == "© stuff ℗ other stuff"
-    assert file["tracktotal"][0] == "14"
-    assert file["date"][0] == "1998-02-13"
-    assert "purchase_date" not in file, file["purchase_date"]
-
-
-def test_tag_flac_cover(sample_metadata):
-    wipe_test_flac()
-    arun(tag_file(test_flac, sample_metadata, test_cover))
-    file = FLAC(test_flac)
+@pytest.mark.parametrize("cover", [None, test_cover], ids=["no_cover", "cover"])
+def test_tag_flac(flac_copy, sample_metadata, cover, cover_bytes):
+    arun(tag_file(flac_copy, sample_metadata, cover))
+    file = FLAC(flac_copy)
     assert file["title"][0] == "testtitle"
     assert file["album"][0] == "testalbum"
     assert file["composer"][0] == "testcomposer"
@@ -91,6 +92,8 @@ def test_tag_flac_cover(sample_metadata):
     assert file["copyright"][0] == "© stuff ℗ other stuff"
     assert file["tracktotal"][0] == "14"
     assert file["date"][0] == "1998-02-13"
-    with open(test_cover, "rb") as img:
-        assert file.pictures[0].data == img.read()
+    if cover is None:
+        assert len(file.pictures) == 0
+    else:
+        assert file.pictures[0].data == cover_bytes
     assert "purchase_date" not in file, file["purchase_date"]
@@ -1,43 +1,79 @@
+import copy
 import os
-import shutil
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from util import arun
 
 import streamrip.db as db
-from streamrip.client.downloadable import Downloadable
+from streamrip.client.downloadable import BasicDownloadable, Downloadable
 from streamrip.client.qobuz import QobuzClient
 from streamrip.media.track import PendingSingle, Track
 
 
-@pytest.mark.skipif(
-    "QOBUZ_EMAIL" not in os.environ, reason="Qobuz credentials not found in env."
-)
-def test_pending_resolve(qobuz_client: QobuzClient):
-    qobuz_client.config.session.downloads.folder = "./tests"
+async def _fake_download(self, path: str, callback):
+    Path(path).touch()
+
+
+async def test_pending_resolve_relative_folder(
+    default_config, qobuz_track_resp, tmp_path, monkeypatch
+):
+    # The album folder is built from downloads.folder, so it must not be
+    # joined onto it a second time
+    monkeypatch.chdir(tmp_path)
+    client = MagicMock(
+        source="qobuz",
+        get_metadata=AsyncMock(return_value=qobuz_track_resp),
+        get_downloadable=AsyncMock(),
+    )
+    default_config.session.downloads.folder = "downloads"
+    default_config.session.filepaths.add_singles_to_folder = True
+    p = PendingSingle(
+        "216020864",
+        client,
+        default_config,
+        db.Database(db.Dummy(), db.Dummy()),
+    )
+    p._download_cover = AsyncMock(return_value=None)
+    t = await p.resolve()
+    dir = os.path.join(
+        "downloads", "The Mountain Goats - Jenny from Thebes (2023) [FLAC] [24B-96kHz]"
+    )
+    assert t.folder == dir
+    assert os.path.isdir(dir)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio(loop_scope="session")
+async def test_pending_resolve(qobuz_client: QobuzClient, tmp_path, mocker):
+    # Only the folder layout is checked, so skip fetching the cover images
+    mocker.patch.object(BasicDownloadable, "download", _fake_download)
+    # Copy the config so that the session-scoped client isn't modified
+    config = copy.deepcopy(qobuz_client.config)
+    config.session.downloads.folder = str(tmp_path)
+    config.session.filepaths.add_singles_to_folder = True
     p = PendingSingle(
         "19512574",
         qobuz_client,
-        qobuz_client.config,
+        config,
         db.Database(db.Dummy(), db.Dummy()),
     )
-    t = arun(p.resolve())
-    dir = "tests/tests/Fleetwood Mac - Rumours (1977) [FLAC] [24B-96kHz]"
+    t = await p.resolve()
+    dir = os.path.join(tmp_path, "Fleetwood Mac - Rumours (1977) [FLAC] [24B-96kHz]")
     assert os.path.isdir(dir)
     assert os.path.isfile(os.path.join(dir, "cover.jpg"))
     # embedded_cover_path aka t.cover_path is
-    # ./tests/./tests/Fleetwood Mac - Rumours (1977) [FLAC] [24B-96kHz]/
+    # {tmp_path}/Fleetwood Mac - Rumours (1977) [FLAC] [24B-96kHz]/
     # __artwork/cover-9202762427033526105.jpg
     assert os.path.isfile(t.cover_path)
     assert isinstance(t, Track)
     assert isinstance(t.downloadable, Downloadable)
     assert t.cover_path is not None
-    shutil.rmtree(dir)
 
 
 # def test_pending_resolve_mp3(qobuz_client: QobuzClient):
 #     qobuz_client.config.session.qobuz.quality = 1
 #     p = PendingSingle("19512574", qobuz_client, qobuz_client.config)
-#     t = arun(p.resolve())
+#     t = await p.resolve()
 #     assert isinstance(t, Track)
 #     assert False
@@ -1,14 +1,16 @@
 import re
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from streamrip import __version__ as init_version
 from streamrip.config import CURRENT_CONFIG_VERSION
+from streamrip.rip.cli import latest_streamrip_version
 
 toml_version_re = re.compile(r'version\s*\=\s*"([\d\.]+)"')
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def pyproject_version() -> str:
     with open("pyproject.toml") as f:
         m = toml_version_re.search(f.read())
@@ -16,7 +18,7 @@ def pyproject_version() -> str:
     return m.group(1)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def config_version() -> str | None:
     with open("streamrip/config.toml") as f:
         m = toml_version_re.search(f.read())
@@ -30,3 +32,28 @@ def test_config_versions_match(config_version):
 
 def test_streamrip_versions_match(pyproject_version):
     assert pyproject_version == init_version
+
+
+def stub_session(*responses: dict) -> MagicMock:
+    session = MagicMock()
+    session.get.side_effect = [
+        MagicMock(
+            __aenter__=AsyncMock(return_value=MagicMock(json=AsyncMock(return_value=r)))
+        )
+        for r in responses
+    ]
+    return session
+
+
+async def test_latest_version_uses_given_session():
+    session = stub_session({"info": {"version": "99.0.0"}}, {"body": "notes"})
+    assert await latest_streamrip_version(session) == ("99.0.0", "notes")
+    assert session.get.call_count == 2
+    session.close.assert_not_called()
+
+
+async def test_latest_version_up_to_date():
+    session = stub_session({"info": {"version": init_version}})
+    assert await latest_streamrip_version(session) == (init_version, None)
+    assert session.get.call_count == 1
+    session.close.assert_not_called()
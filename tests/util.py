@@ -8,10 +8,7 @@ def arun(coro):
 
 
 def afor(async_gen):
-    async def _afor(async_gen):
-        l = []
-        async for item in async_gen:
-            l.append(item)
-        return l
+    async def _collect():
+        return [item async for item in async_gen]
 
-    return arun(_afor(async_gen))
+    return arun(_collect())